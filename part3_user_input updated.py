@@ -11,6 +11,8 @@ Learn:
 
 
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 
 #  USER INFO 
 def get_user_info():
@@ -33,6 +35,40 @@ def get_user_info():
         print("User not found.")
 
 #  POSTS + COMMENTS 
+def fetch_json(url, params, expires_at):
+    timeout = expires_at - time.monotonic()
+    if timeout <= 0:
+        raise requests.Timeout("No time left before the deadline")
+    response = requests.get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+def fetch_all_within(requests_by_name, seconds=5):
+    # Fetch several URLs in parallel under one overall time budget.
+    # Returns (results, errors): each name ends up in exactly one of them,
+    # with errors saying whether it timed out or what went wrong.
+    expires_at = time.monotonic() + seconds
+    pool = ThreadPoolExecutor(max_workers=len(requests_by_name))
+    futures = {
+        name: pool.submit(fetch_json, url, params, expires_at)
+        for name, (url, params) in requests_by_name.items()
+    }
+    wait(futures.values(), timeout=seconds)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    results = {}
+    errors = {}
+    for name, future in futures.items():
+        if not future.done() or future.cancelled():
+            errors[name] = "timed out"
+        elif isinstance(future.exception(), requests.Timeout):
+            errors[name] = "timed out"
+        elif future.exception() is not None:
+            errors[name] = str(future.exception())
+        else:
+            results[name] = future.result()
+    return results, errors
+
 def search_posts_with_comments():
     print("\n=== User Posts & Comments ===\n")
     user_id = input("Enter user ID (1-10): ").strip()
@@ -40,10 +76,18 @@ def search_posts_with_comments():
         print("Please enter a valid number.")
         return
 
-    # Fetch posts
-    posts = requests.get("https://jsonplaceholder.typicode.com/posts").json()
-    # Fetch comments
-    comments = requests.get("https://jsonplaceholder.typicode.com/comments").json()
+    # Fetch posts and comments at the same time, 5 seconds in total
+    results, errors = fetch_all_within({
+        "posts": ("https://jsonplaceholder.typicode.com/posts", {"userId": user_id}),
+        "comments": ("https://jsonplaceholder.typicode.com/comments", None),
+    })
+    if "posts" in errors:
+        print(f"Could not fetch posts: {errors['posts']}")
+        return
+    posts = results["posts"]
+    comments = results.get("comments", [])
+    if "comments" in errors:
+        print(f"Could not fetch comments ({errors['comments']}), showing posts only.")
 
     found_posts = False
     for post in posts:
@@ -103,14 +147,14 @@ def get_weather():
         return
 
     lat, lon = CITIES[city]
-    url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current_weather=true"
+    url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m,wind_speed_10m"
     response = requests.get(url)
     if response.status_code == 200:
         data = response.json()
-        weather = data["current_weather"]
+        weather = data["current"]
         print(f"\nWeather in {city.title()}:")
-        print(f"Temperature: {weather['temperature']}°C")
-        print(f"Wind Speed: {weather['windspeed']} km/h")
+        print(f"Temperature: {weather['temperature_2m']}°C")
+        print(f"Wind Speed: {weather['wind_speed_10m']} km/h")
     else:
         print("Could not fetch weather.")
 
@@ -122,8 +166,9 @@ def search_todos():
         print("Invalid input.")
         return
 
-    todos = requests.get("https://jsonplaceholder.typicode.com/todos").json()
-    filtered = [todo for todo in todos if str(todo["completed"]).lower() == status]
+    # Let the server filter instead of downloading every todo
+    url = "https://jsonplaceholder.typicode.com/todos"
+    filtered = requests.get(url, params={"completed": status}, timeout=10).json()
     print(f"Total todos with completed={status}: {len(filtered)}")
     for todo in filtered[:5]:  # Show first 5 for brevity
         print("-", todo["title"])
@@ -13,17 +13,111 @@ Learn:
 import requests
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures import TimeoutError as FutureTimeout
 from requests.exceptions import ConnectionError, Timeout, HTTPError, RequestException
 
 logging.basicConfig(level=logging.INFO)
 
 
-def safe_api_request(url, timeout=5):
+# -------------------------------
+# Hedged GET (opt-in)
+# -------------------------------
+# If the first attempt hasn't answered after HEDGE_DELAY seconds, send one
+# more copy and keep whichever response arrives first. (part5 picks the
+# delay from each host's recent latency instead of a fixed value.)
+
+HEDGE_DELAY = 1.0
+HEDGE_BUDGET = 0.1  # at most ~10% extra requests
+
+hedge_pool = ThreadPoolExecutor(max_workers=8)
+hedge_lock = threading.Lock()
+hedge_stats = {"requests": 0, "hedged": 0, "hedge_won": 0}
+
+
+def hedged_get(url, timeout=5):
+    with hedge_lock:
+        hedge_stats["requests"] += 1
+        allowed = hedge_stats["hedged"] < hedge_stats["requests"] * HEDGE_BUDGET
+
+    attempts = [hedge_pool.submit(requests.get, url, timeout=timeout)]
+    done, _ = wait(attempts, timeout=HEDGE_DELAY)
+    if not done and allowed:
+        with hedge_lock:
+            hedge_stats["hedged"] += 1
+        logging.info(f"Hedging slow request: {url}")
+        attempts.append(hedge_pool.submit(requests.get, url, timeout=timeout))
+
+    pending = set(attempts)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        winners = [f for f in done if f.exception() is None]
+        if winners:
+            if winners[0] is not attempts[0]:
+                with hedge_lock:
+                    hedge_stats["hedge_won"] += 1
+            # The slower copy can't be aborted mid-flight; close it when it ends
+            for loser in winners[1:] + list(pending):
+                loser.add_done_callback(lambda f: f.exception() or f.result().close())
+            return winners[0].result()
+    raise attempts[0].exception()
+
+
+def show_hedge_stats():
+    print(f"\nHedging: {hedge_stats['requests']} requests, "
+          f"{hedge_stats['hedged']} hedged, {hedge_stats['hedge_won']} won by the hedge")
+
+
+# -------------------------------
+# Deadlines
+# -------------------------------
+# One time budget for a whole operation. Every request, retry and sleep
+# inside it only gets whatever time is left.
+
+class Deadline:
+    def __init__(self, seconds):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return self.remaining() <= 0
+
+
+DEADLINE_EXCEEDED = "Deadline exceeded"
+
+# requests' timeout only limits connecting and the gap between reads, so a
+# server that trickles its body can run past it. Calls under a deadline run
+# here and are waited on for the remaining time only.
+deadline_pool = ThreadPoolExecutor(max_workers=16)
+
+
+def get_json(url, timeout, hedge):
+    response = hedged_get(url, timeout=timeout) if hedge else requests.get(url, timeout=timeout)
+    with response:
+        response.raise_for_status()
+        return response.json()
+
+
+def safe_api_request(url, timeout=5, hedge=False, deadline=None):
     try:
         logging.info(f"Calling API: {url}")
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
-        return {"success": True, "data": response.json()}
+        if deadline is None:
+            return {"success": True, "data": get_json(url, timeout, hedge)}
+
+        # Read the clock once: a timeout of 0 would make requests raise a
+        # plain ValueError instead of a RequestException.
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            return {"success": False, "error": DEADLINE_EXCEEDED}
+        future = deadline_pool.submit(get_json, url, min(timeout, remaining), hedge)
+        try:
+            return {"success": True, "data": future.result(timeout=deadline.remaining())}
+        except FutureTimeout:
+            future.cancel()
+            return {"success": False, "error": DEADLINE_EXCEEDED}
 
     except ConnectionError:
         return {"success": False, "error": "Internet connection problem"}
@@ -42,16 +136,24 @@ def safe_api_request(url, timeout=5):
 # Exercise 1: Retry Logic
 # -------------------------------
 
-def safe_request_with_retry(url, retries=3):
+def safe_request_with_retry(url, retries=3, deadline=None):
+    last_error = None
     for attempt in range(1, retries + 1):
         print(f"Attempt {attempt}")
-        result = safe_api_request(url)
+        result = safe_api_request(url, deadline=deadline)
 
         if result["success"]:
             return result
 
-        print("Retrying...")
-        time.sleep(1)
+        if result["error"] != DEADLINE_EXCEEDED:
+            last_error = result["error"]
+        if deadline is not None and (deadline.expired() or result["error"] == DEADLINE_EXCEEDED):
+            error = DEADLINE_EXCEEDED if last_error is None else f"{DEADLINE_EXCEEDED} ({last_error})"
+            return {"success": False, "error": error}
+
+        if attempt < retries:
+            print("Retrying...")
+            time.sleep(1 if deadline is None else min(1, deadline.remaining()))
 
     return {"success": False, "error": "Failed after retries"}
 
@@ -72,7 +174,7 @@ def fetch_crypto_safely():
     coin = input("Enter coin (btc-bitcoin / eth-ethereum): ").strip().lower()
     url = f"https://api.coinpaprika.com/v1/tickers/{coin}"
 
-    result = safe_request_with_retry(url)
+    result = safe_request_with_retry(url, deadline=Deadline(10))
 
     if result["success"]:
         data = result["data"]
@@ -107,8 +209,18 @@ def demo_error_handling():
             print("Error:", result["error"])
 
 
+def demo_hedging():
+    print("\nHedged Requests Demo\n")
+
+    for post_id in range(1, 11):
+        result = safe_api_request(f"https://jsonplaceholder.typicode.com/posts/{post_id}", hedge=True)
+        print("Success:" if result["success"] else "Error:", post_id)
+    show_hedge_stats()
+
+
 def main():
     demo_error_handling()
+    demo_hedging()
     fetch_crypto_safely()
 
 
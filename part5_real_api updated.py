@@ -13,7 +13,24 @@ Learn:
 import requests
 import json
 import os
-from datetime import datetime, timedelta
+import re
+import threading
+import time
+import unicodedata
+import warnings
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 #  CITY & CRYPTO DATA 
 CITIES = {
@@ -40,20 +57,182 @@ CRYPTO_IDS = {
     "ripple": "xrp-xrp"
 }
 
+# HTTP HELPERS 
+_thread_local = threading.local()
+
+def get_session(pool_size):
+    # One pooled session per worker thread, reused for every request it sends
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _thread_local.session = session
+    return session
+
+# HEDGED REQUESTS 
+# If a GET is slower than the host's recent p95 latency, a second copy is
+# sent and whichever answers first wins. Enable with HEDGE_REQUESTS=1 or
+# pass hedge=True to the lookup functions.
+HEDGE_ENABLED = os.environ.get("HEDGE_REQUESTS") == "1"
+HEDGE_PERCENTILE = 95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_DEFAULT_DELAY = 1.0   # seconds, used until a host has enough samples
+HEDGE_BUDGET = 0.1          # hedges may add at most ~10% extra requests per host
+
+_hedge_pool = ThreadPoolExecutor(max_workers=16)
+_hedge_lock = threading.Lock()
+_host_latencies = {}
+hedge_stats = {}
+
+def record_latency(host, seconds):
+    with _hedge_lock:
+        _host_latencies.setdefault(host, deque(maxlen=200)).append(seconds)
+
+def hedge_delay(host):
+    with _hedge_lock:
+        samples = sorted(_host_latencies.get(host, ()))
+    if len(samples) < HEDGE_MIN_SAMPLES:
+        return HEDGE_DEFAULT_DELAY
+    return samples[min(len(samples) - 1, len(samples) * HEDGE_PERCENTILE // 100)]
+
+def timed_get(url, params, timeout, stream=False):
+    start = time.perf_counter()
+    res = get_session(16).get(url, params=params, timeout=timeout, stream=stream)
+    return res, time.perf_counter() - start
+
+def discard_attempt(host, future):
+    # requests can't abort a call in flight, so the loser is cancelled if it
+    # hasn't started yet, otherwise its connection is released when it ends.
+    if future.cancel():
+        return
+    def cleanup(f):
+        if f.exception() is None:
+            res, elapsed = f.result()
+            res.close()
+            record_latency(host, elapsed)
+    future.add_done_callback(cleanup)
+
+def hedged_get(url, params=None, timeout=10, stream=False):
+    host = urlparse(url).netloc
+    with _hedge_lock:
+        stats = hedge_stats.setdefault(host, {"requests": 0, "hedged": 0, "hedge_won": 0})
+        stats["requests"] += 1
+
+    primary = _hedge_pool.submit(timed_get, url, params, timeout, stream)
+    pending = {primary}
+    done, _ = wait(pending, timeout=hedge_delay(host))
+    if not done:
+        with _hedge_lock:
+            allowed = stats["hedged"] < stats["requests"] * HEDGE_BUDGET
+            if allowed:
+                stats["hedged"] += 1
+        if allowed:
+            pending.add(_hedge_pool.submit(timed_get, url, params, timeout, stream))
+
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        winner = None
+        for future in done:
+            if future.exception() is not None:
+                error = error or future.exception()
+            elif winner is None:
+                winner = future
+            else:
+                discard_attempt(host, future)
+        if winner is not None:
+            res, elapsed = winner.result()
+            record_latency(host, elapsed)
+            if winner is not primary:
+                with _hedge_lock:
+                    stats["hedge_won"] += 1
+            for future in pending:
+                discard_attempt(host, future)
+            return res
+    raise error
+
+def http_get(url, params=None, timeout=10, hedge=None, stream=False):
+    if hedge is None:
+        hedge = HEDGE_ENABLED
+    if hedge:
+        return hedged_get(url, params=params, timeout=timeout, stream=stream)
+    return get_session(16).get(url, params=params, timeout=timeout, stream=stream)
+
+def show_hedge_stats():
+    print("\nHedged Request Stats")
+    print(f"{'Host':<40}{'Requests':<10}{'Hedged':<9}{'Won'}")
+    print("-"*62)
+    with _hedge_lock:
+        rows = [(host, dict(stats)) for host, stats in hedge_stats.items()]
+    if not rows:
+        print("No hedged requests yet.")
+    for host, stats in rows:
+        print(f"{host:<40}{stats['requests']:<10}{stats['hedged']:<9}{stats['hedge_won']}")
+
+# BANDWIDTH ACCOUNTING 
+# requests already asks for gzip/deflate, plus br and zstd when the brotli or
+# zstandard packages are installed, so no Accept-Encoding header is set here.
+_bytes_lock = threading.Lock()
+bytes_stats = {}
+
+def fetch_json(url, params=None, timeout=10, hedge=None):
+    # Streams the body so compressed responses are decoded chunk by chunk,
+    # and records bytes on the wire vs. decoded bytes per endpoint.
+    res = http_get(url, params=params, timeout=timeout, hedge=hedge, stream=True)
+    with res:
+        if not res.ok:
+            res.content  # keep the error body readable from e.response after closing
+            res.raise_for_status()
+        chunks = []
+        decoded = 0
+        for chunk in res.iter_content(chunk_size=16384):
+            chunks.append(chunk)
+            decoded += len(chunk)
+        wire = res.raw.tell()
+
+    parsed = urlparse(url)
+    endpoint = parsed.netloc + parsed.path
+    with _bytes_lock:
+        stats = bytes_stats.setdefault(endpoint, {"requests": 0, "wire_bytes": 0, "decoded_bytes": 0})
+        stats["requests"] += 1
+        stats["wire_bytes"] += wire
+        stats["decoded_bytes"] += decoded
+    # Keep callers' `except requests.RequestException` working, as with res.json()
+    try:
+        return json.loads(b"".join(chunks))
+    except json.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+    except ValueError as e:  # e.g. UnicodeDecodeError for a body that isn't UTF-8
+        raise requests.RequestException(f"Invalid JSON response from {url}: {e}")
+
+def show_bandwidth_stats():
+    print("\nBandwidth Stats")
+    print(f"{'Endpoint':<55}{'Reqs':<6}{'Wire KB':<10}{'Decoded KB':<12}{'Saved'}")
+    print("-"*90)
+    with _bytes_lock:
+        rows = [(endpoint, dict(stats)) for endpoint, stats in bytes_stats.items()]
+    if not rows:
+        print("No requests yet.")
+    for endpoint, stats in rows:
+        saved = 1 - stats["wire_bytes"] / stats["decoded_bytes"] if stats["decoded_bytes"] else 0
+        print(f"{endpoint[:54]:<55}{stats['requests']:<6}{stats['wire_bytes'] / 1024:<10.1f}"
+              f"{stats['decoded_bytes'] / 1024:<12.1f}{saved:.0%}")
+
 # WEATHER FUNCTIONS 
-def get_weather(city):
+def get_weather(city, hedge=None):
     city = city.lower().strip()
     if city not in CITIES:
         print(f"City '{city}' not found. Available: {', '.join(CITIES.keys())}")
         return None
     lat, lon = CITIES[city]
-    url = "https://air-quality-api.open-meteo.com/v1/air-quality"
+    url = "https://api.open-meteo.com/v1/forecast"
 
-    params = {"latitude": lat, "longitude": lon, "current_weather": True, "timezone": "auto"}
+    # Ask only for the fields show_weather prints
+    params = {"latitude": lat, "longitude": lon, "current": "temperature_2m,wind_speed_10m,wind_direction_10m"}
     try:
-        res = requests.get(url, params=params, timeout=10)
-        res.raise_for_status()
-        return res.json()
+        return fetch_json(url, params=params, timeout=10, hedge=hedge)
     except requests.RequestException as e:
         print(f"Weather fetch error: {e}")
         return None
@@ -61,20 +240,18 @@ def get_weather(city):
 def show_weather(city):
     data = get_weather(city)
     if not data: return
-    current = data["current_weather"]
+    current = data["current"]
     print(f"\nWeather in {city.title()}:")
-    print(f"Temperature: {current['temperature']}°C")
-    print(f"Wind Speed: {current['windspeed']} km/h")
-    print(f"Wind Direction: {current['winddirection']}°")
+    print(f"Temperature: {current['temperature_2m']}°C")
+    print(f"Wind Speed: {current['wind_speed_10m']} km/h")
+    print(f"Wind Direction: {current['wind_direction_10m']}°")
 
 # CRYPTO FUNCTIONS
-def get_crypto_price(coin):
+def get_crypto_price(coin, hedge=None):
     coin_id = CRYPTO_IDS.get(coin.lower(), coin.lower())
     url = f"https://api.coinpaprika.com/v1/tickers/{coin_id}"
     try:
-        res = requests.get(url, timeout=10)
-        res.raise_for_status()
-        return res.json()
+        return fetch_json(url, timeout=10, hedge=hedge)
     except requests.RequestException as e:
         print(f"Crypto fetch error: {e}")
         return None
@@ -99,6 +276,137 @@ def compare_cryptos(coins):
             usd = data["quotes"]["USD"]
             print(f"{data['name']:<15}${usd['price']:<14.2f}{usd['percent_change_24h']:+.2f}%")
 
+# CRYPTO HISTORY (OHLCV)
+OHLCV_CACHE_DIR = "ohlcv_cache"
+OHLCV_MAX_DAYS = 366  # coinpaprika returns at most 366 candles per request
+
+def fetch_ohlcv_year(coin_id, year):
+    # Candles are fetched one calendar year at a time (never more than 366
+    # days). Past years never change, so they are cached on disk under a key
+    # that stays the same from day to day; the current year is always fetched fresh.
+    today = datetime.now().date()
+    start = datetime(year, 1, 1).date()
+    end = min(datetime(year, 12, 31).date(), today)
+    cache_file = os.path.join(OHLCV_CACHE_DIR, f"{coin_id}_{year}.json")
+    cacheable = year < today.year
+    if cacheable and os.path.exists(cache_file):
+        try:
+            with open(cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass  # unreadable cache file: fetch it again
+
+    url = f"https://api.coinpaprika.com/v1/coins/{coin_id}/ohlcv/historical"
+    params = {"start": start.isoformat(), "end": end.isoformat(), "limit": OHLCV_MAX_DAYS}
+    candles = fetch_json(url, params=params, timeout=10, hedge=False)
+
+    if cacheable:
+        os.makedirs(OHLCV_CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(candles, f)
+        os.replace(tmp_file, cache_file)
+    return candles
+
+def get_crypto_history(coins, days=365, workers=8):
+    # Returns (coin_ids, dates, closes) where closes has shape (len(coin_ids), days)
+    # and holds NaN for days a coin has no candle.
+    coin_ids = [CRYPTO_IDS.get(c.lower(), c.lower()) for c in coins]
+    end = datetime.now().date()
+    start = end - timedelta(days=days - 1)
+    years = range(start.year, end.year + 1)
+
+    dates = np.arange(np.datetime64(start), np.datetime64(end) + 1)
+    closes = np.full((len(coin_ids), len(dates)), np.nan)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(fetch_ohlcv_year, coin_id, year): row
+            for row, coin_id in enumerate(coin_ids)
+            for year in years
+        }
+        for future, row in futures.items():
+            try:
+                candles = future.result()
+            except requests.RequestException as e:
+                print(f"History fetch error ({coin_ids[row]}): {e}")
+                continue
+            if not candles:
+                continue
+            days_open = np.array([c["time_open"][:10] for c in candles], dtype="datetime64[D]")
+            prices = np.array([c["close"] for c in candles], dtype=float)
+            # Years are fetched whole, so keep only the requested range
+            cols = (days_open - dates[0]).astype(int)
+            keep = (cols >= 0) & (cols < len(dates))
+            closes[row, cols[keep]] = prices[keep]
+    return coin_ids, dates, closes
+
+def forward_fill(values):
+    # Carry the last seen value forward along each row (leading NaNs stay NaN)
+    idx = np.where(np.isnan(values), 0, np.arange(values.shape[1]))
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    return values[np.arange(values.shape[0])[:, None], idx]
+
+def correlation_matrix(returns):
+    # Pairwise correlation using only the days both coins have a return
+    mask = np.isfinite(returns).astype(float)
+    x = np.where(mask > 0, returns, 0.0)
+    n = mask @ mask.T
+    sum_x = x @ mask.T
+    sum_xx = (x * x) @ mask.T
+    sum_xy = x @ x.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sum_xy - sum_x * sum_x.T / n
+        var_x = sum_xx - sum_x ** 2 / n
+        corr = cov / np.sqrt(var_x * var_x.T)
+    corr[n < 2] = np.nan
+    return corr
+
+def crypto_history_stats(closes):
+    # Returns come from the raw closes, so a missing candle leaves NaN returns
+    # rather than fake zero-return days. The forward-filled prices are only
+    # used for total return and drawdown.
+    prices = forward_fill(closes)
+    # Coins with no candles in range yield NaN stats rather than warnings
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        log_returns = np.diff(np.log(closes), axis=1)
+        first = np.take_along_axis(prices, np.argmax(np.isfinite(prices), axis=1)[:, None], axis=1)[:, 0]
+        total_return = prices[:, -1] / first - 1
+        volatility = np.nanstd(log_returns, axis=1) * np.sqrt(365)
+        drawdowns = prices / np.fmax.accumulate(prices, axis=1) - 1
+        max_drawdown = np.nanmin(drawdowns, axis=1)
+    return {
+        "returns": log_returns,
+        "total_return": total_return,
+        "volatility": volatility,
+        "max_drawdown": max_drawdown,
+        "correlation": correlation_matrix(log_returns),
+    }
+
+def compare_crypto_history(coins, days=365):
+    if np is None:
+        print("NumPy is required for historical comparison (pip install numpy).")
+        return None
+    if days < 2:
+        print("Need at least 2 days of history to compute returns.")
+        return None
+    coin_ids, dates, closes = get_crypto_history(coins, days=days)
+    stats = crypto_history_stats(closes)
+
+    print(f"\nCrypto History ({dates[0]} to {dates[-1]})")
+    print(f"{'Coin':<18}{'Return':<12}{'Volatility':<13}{'Max Drawdown'}")
+    print("-"*55)
+    for i, coin_id in enumerate(coin_ids):
+        print(f"{coin_id:<18}{stats['total_return'][i]:<+12.2%}{stats['volatility'][i]:<13.2%}{stats['max_drawdown'][i]:.2%}")
+
+    if len(coin_ids) <= 10:
+        print("\nCorrelation of daily returns:")
+        print(" " * 18 + "".join(f"{c[:8]:>9}" for c in coin_ids))
+        for i, coin_id in enumerate(coin_ids):
+            print(f"{coin_id:<18}" + "".join(f"{v:>9.2f}" for v in stats["correlation"][i]))
+    return stats
+
 # POST & SAVE 
 def make_post():
     url = "https://jsonplaceholder.typicode.com/posts"
@@ -110,6 +418,112 @@ def make_post():
     except requests.RequestException as e:
         print(f"POST error: {e}")
 
+# BULK POST 
+# POSTs aren't idempotent, so only retry when the server can't have acted on
+# the request: the connection never went through, or it said "try again".
+RETRYABLE_STATUS = {429, 503}
+RETRY_AFTER_MAX = 30  # seconds; a longer Retry-After would stall the whole run
+
+def read_payloads(source):
+    # source is either a JSON Lines file path or any iterable of dicts
+    if isinstance(source, str):
+        with open(source) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+    else:
+        yield from source
+
+def retry_after_seconds(res, default):
+    # Retry-After is either a number of seconds or an HTTP date
+    value = res.headers.get("Retry-After")
+    if not value:
+        return default
+    if value.strip().isdigit():
+        seconds = int(value)
+    else:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return default
+    return min(max(0.0, seconds), max(default, RETRY_AFTER_MAX))
+
+def request_never_sent(e):
+    # True only if the connection was never established: a connect timeout,
+    # or a refused/unresolvable host. A connection dropped mid-response
+    # ("Connection aborted.") may come after the server stored the record.
+    if isinstance(e, requests.ConnectTimeout):
+        return True
+    reason = getattr(e.args[0], "reason", None) if e.args else None
+    return isinstance(reason, NewConnectionError)
+
+def post_with_retry(url, index, payload, retries=3, timeout=5, backoff=0.2, pool_size=10):
+    session = get_session(pool_size)
+    error = None
+    for attempt in range(1, retries + 1):
+        delay = backoff * 2 ** (attempt - 1)
+        try:
+            res = session.post(url, json=payload, timeout=timeout)
+        except requests.RequestException as e:
+            if not request_never_sent(e):
+                return {"index": index, "success": False, "error": f"{type(e).__name__}: {e}", "attempts": attempt}
+            error = f"{type(e).__name__}: {e}"
+        else:
+            if res.status_code not in RETRYABLE_STATUS:
+                result = {"index": index, "success": res.ok, "status": res.status_code, "attempts": attempt}
+                if not res.ok:
+                    result["error"] = f"HTTP error {res.status_code}"
+                return result
+            error = f"HTTP error {res.status_code}"
+            delay = retry_after_seconds(res, delay)
+        if attempt < retries:
+            time.sleep(delay)
+    return {"index": index, "success": False, "error": error, "attempts": retries}
+
+def bulk_post(source, url="https://jsonplaceholder.typicode.com/posts", workers=10, retries=3, timeout=5):
+    # Yields one result per payload as soon as it finishes. At most 2 * workers
+    # requests are in flight, so a huge file is never read into memory at once.
+    max_in_flight = workers * 2
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for index, payload in enumerate(read_payloads(source)):
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(pool.submit(post_with_retry, url, index, payload, retries, timeout, pool_size=workers))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+def run_bulk_post(source, url="https://jsonplaceholder.typicode.com/posts", workers=10, verbose=True):
+    summary = {"total": 0, "succeeded": 0, "failed": 0, "retried": 0, "errors": {}}
+    start = time.perf_counter()
+    for result in bulk_post(source, url=url, workers=workers):
+        summary["total"] += 1
+        if result["attempts"] > 1:
+            summary["retried"] += 1
+        if result["success"]:
+            summary["succeeded"] += 1
+        else:
+            summary["failed"] += 1
+            summary["errors"][result["error"]] = summary["errors"].get(result["error"], 0) + 1
+        if verbose:
+            status = result.get("status", "-")
+            print(f"#{result['index']}: {'OK' if result['success'] else 'FAIL'} status={status} attempts={result['attempts']}")
+    elapsed = time.perf_counter() - start
+    summary["elapsed"] = round(elapsed, 3)
+    summary["per_second"] = round(summary["total"] / elapsed, 1) if elapsed else 0.0
+
+    print("\nBulk POST Summary:")
+    print(f"Sent: {summary['total']}, OK: {summary['succeeded']}, Failed: {summary['failed']}, Retried: {summary['retried']}")
+    print(f"Time: {summary['elapsed']}s ({summary['per_second']} req/s)")
+    for error, count in summary["errors"].items():
+        print(f"  {count} x {error}")
+    return summary
+
 def save_to_file(data, filename="results.json"):
     with open(filename, "w") as f:
         json.dump(data, f, indent=2)
@@ -131,27 +545,321 @@ def get_weather_openweathermap(city):
         print(f"Error: {e}")
 
 # OMDB API 
-def get_movie_info():
-    api_key = "dbe12aae"
+# Every title we look up is kept in a local catalog so repeated titles and
+# known misses don't spend quota on the shared key. Misses expire sooner
+# than hits, since a title may be added to OMDB later.
+OMDB_API_KEY = os.environ.get("OMDB_API_KEY", "dbe12aae")
+OMDB_URL = "https://www.omdbapi.com/"
+OMDB_CATALOG_FILE = "omdb_catalog.json"
+OMDB_HIT_TTL = 30 * 24 * 3600
+OMDB_MISS_TTL = 24 * 3600
+OMDB_BATCH_SIZE = 10
+OMDB_MIN_INTERVAL = 0.25    # seconds between background lookups
+OMDB_LIMIT_BACKOFF = 300    # pause after "Request limit reached!"
+MOVIE_NOT_FOUND = {"Response": "False", "Error": "Movie not found!"}
+
+_catalog_lock = threading.RLock()
+# {"titles": {key: {"imdbID", "fetched_at"}}, "movies": {imdbID: data},
+#  "fetched_at": {imdbID: ts}, "searches": {key: ts}}
+_catalog = None
+_prefix_keys = []     # sorted title keys that point at a movie
+_trigrams = {}        # trigram -> set of title keys
+_lookup_queue = deque()
+_queued_keys = set()
+_lookup_wakeup = threading.Event()
+_lookup_thread = None
+
+def normalize_title(title):
+    # "  Amélie (2001)! " and "amelie 2001" share the key "amelie 2001"
+    title = unicodedata.normalize("NFKD", title)
+    title = "".join(c for c in title if not unicodedata.combining(c)).casefold()
+    return " ".join(re.sub(r"[\W_]+", " ", title).split())
+
+def is_imdb_id(value):
+    return re.fullmatch(r"tt\d+", value) is not None
+
+def is_full_record(data):
+    # Results from OMDB's s= search only carry Title/Year/imdbID/Type/Poster
+    return "Plot" in data
+
+def title_trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def index_title(key, imdb_id):
+    with _catalog_lock:
+        if imdb_id is None:
+            return
+        i = bisect_left(_prefix_keys, key)
+        if i == len(_prefix_keys) or _prefix_keys[i] != key:
+            _prefix_keys.insert(i, key)
+        for gram in title_trigrams(key):
+            _trigrams.setdefault(gram, set()).add(key)
+
+def unindex_title(key):
+    with _catalog_lock:
+        i = bisect_left(_prefix_keys, key)
+        if i < len(_prefix_keys) and _prefix_keys[i] == key:
+            del _prefix_keys[i]
+        for gram in title_trigrams(key):
+            keys = _trigrams.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del _trigrams[gram]
+
+def load_catalog():
+    global _catalog
+    with _catalog_lock:
+        if _catalog is not None:
+            return _catalog
+        _catalog = {"titles": {}, "movies": {}}
+        if os.path.exists(OMDB_CATALOG_FILE):
+            try:
+                with open(OMDB_CATALOG_FILE) as f:
+                    _catalog = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Could not read {OMDB_CATALOG_FILE}, starting a new catalog: {e}")
+        _catalog.setdefault("fetched_at", {})
+        _catalog.setdefault("searches", {})
+        for key, entry in _catalog["titles"].items():
+            if not is_imdb_id(key):
+                index_title(key, entry["imdbID"])
+        return _catalog
+
+def save_catalog():
+    with _catalog_lock:
+        tmp_file = OMDB_CATALOG_FILE + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(load_catalog(), f)
+        os.replace(tmp_file, OMDB_CATALOG_FILE)
+
+def set_title(key, imdb_id, now):
+    catalog = load_catalog()
+    with _catalog_lock:
+        catalog["titles"][key] = {"imdbID": imdb_id, "fetched_at": now}
+        if imdb_id is None:
+            unindex_title(key)
+        else:
+            index_title(key, imdb_id)
+
+def record_movie(data, now):
+    # A search summary never replaces a full record we already have
+    catalog = load_catalog()
+    imdb_id = data["imdbID"]
+    with _catalog_lock:
+        if is_full_record(data) or imdb_id not in catalog["movies"]:
+            catalog["movies"][imdb_id] = data
+            catalog["fetched_at"][imdb_id] = now
+    set_title(normalize_title(data["Title"]), imdb_id, now)
+
+def record_lookup(query, data):
+    # Only definite answers are cached; rate limits and key errors are not misses
+    if data.get("Response") != "True" and data.get("Error") != MOVIE_NOT_FOUND["Error"]:
+        return
+    catalog = load_catalog()
+    now = time.time()
+    key = None if is_imdb_id(query) else normalize_title(query)
+    if data.get("Response") == "True":
+        record_movie(data, now)
+        if key:
+            set_title(key, data["imdbID"], now)
+        return
+    if not key:
+        return
+    with _catalog_lock:
+        entry = catalog["titles"].get(key)
+        if entry and entry["imdbID"]:
+            # A refresh that misses keeps the known hit; just don't retry it
+            # until the TTL runs out again.
+            entry["fetched_at"] = now
+            return
+        set_title(key, None, now)
+
+def record_search(query, data):
+    if data.get("Response") != "True" and data.get("Error") != MOVIE_NOT_FOUND["Error"]:
+        return
+    catalog = load_catalog()
+    now = time.time()
+    for item in data.get("Search", []):
+        record_movie(item, now)
+    with _catalog_lock:
+        catalog["searches"][normalize_title(query)] = now
+
+def omdb_get(params):
+    # OMDB answers "Request limit reached!" and "Invalid API key!" with a 401
+    # and a JSON body, so return that body for callers to inspect
+    try:
+        return fetch_json(OMDB_URL, params={"apikey": OMDB_API_KEY, **params}, timeout=10, hedge=False)
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 401:
+            try:
+                return e.response.json()
+            except ValueError:
+                pass
+        raise
 
+def fetch_movie(title):
+    return omdb_get({"i": title} if is_imdb_id(title) else {"t": title})
+
+def search_omdb(query):
+    return omdb_get({"s": query})
+
+def lookup_movie(title):
+    # Returns OMDB-shaped data, from the catalog when it is fresh enough
+    title = title.strip()
+    if is_imdb_id(title):
+        return lookup_movie_by_id(title)
+    key = normalize_title(title)
+    if not key:
+        return MOVIE_NOT_FOUND
+    catalog = load_catalog()
+    with _catalog_lock:
+        entry = catalog["titles"].get(key)
+    if entry:
+        age = time.time() - entry["fetched_at"]
+        if entry["imdbID"]:
+            movie = catalog["movies"][entry["imdbID"]]
+            if not is_full_record(movie):
+                return lookup_movie_by_id(entry["imdbID"])
+            if age > OMDB_HIT_TTL:
+                queue_lookups([title])  # serve the old copy, refresh in the background
+            return movie
+        if age < OMDB_MISS_TTL:
+            return MOVIE_NOT_FOUND
+
+    data = fetch_movie(title)
+    record_lookup(title, data)
+    save_catalog()
+    return data
+
+def lookup_movie_by_id(imdb_id):
+    catalog = load_catalog()
+    with _catalog_lock:
+        movie = catalog["movies"].get(imdb_id)
+        age = time.time() - catalog["fetched_at"].get(imdb_id, 0)
+    if movie and is_full_record(movie):
+        if age > OMDB_HIT_TTL:
+            queue_lookups([imdb_id])
+        return movie
+
+    data = fetch_movie(imdb_id)
+    record_lookup(imdb_id, data)
+    save_catalog()
+    return data
+
+def search_catalog(query, limit=10):
+    # Prefix matches first, then partial matches ranked by shared trigrams
+    key = normalize_title(query)
+    if not key:
+        return []
+    catalog = load_catalog()
+    with _catalog_lock:
+        keys = []
+        i = bisect_left(_prefix_keys, key)
+        while i < len(_prefix_keys) and _prefix_keys[i].startswith(key):
+            keys.append(_prefix_keys[i])
+            i += 1
+
+        grams = title_trigrams(key)
+        scores = {}
+        for gram in grams:
+            for title_key in _trigrams.get(gram, ()):
+                scores[title_key] = scores.get(title_key, 0) + 1
+        keys += sorted((k for k in scores if scores[k] * 2 >= len(grams)), key=lambda k: -scores[k])
+
+        results = []
+        seen = set()
+        for title_key in keys:
+            imdb_id = catalog["titles"][title_key]["imdbID"]
+            if imdb_id is None or imdb_id in seen:
+                continue
+            seen.add(imdb_id)
+            results.append(catalog["movies"][imdb_id])
+            if len(results) == limit:
+                break
+        return results
+
+def queue_lookups(titles, kind="title"):
+    # Fill the catalog in the background, a batch at a time, without
+    # exceeding OMDB_MIN_INTERVAL between requests. kind is "title" for an
+    # exact t=/i= lookup or "search" for OMDB's partial-title s= search.
+    global _lookup_thread
+    with _catalog_lock:
+        for title in titles:
+            key = (kind, normalize_title(title))
+            if key[1] and key not in _queued_keys:
+                _queued_keys.add(key)
+                _lookup_queue.append((kind, title.strip()))
+        if _lookup_thread is None:
+            _lookup_thread = threading.Thread(target=lookup_worker, daemon=True)
+            _lookup_thread.start()
+    _lookup_wakeup.set()
+
+def lookup_worker():
+    while True:
+        _lookup_wakeup.wait()
+        with _catalog_lock:
+            batch = [_lookup_queue.popleft() for _ in range(min(OMDB_BATCH_SIZE, len(_lookup_queue)))]
+            if not _lookup_queue:
+                _lookup_wakeup.clear()
+
+        for n, (kind, title) in enumerate(batch):
+            try:
+                data = search_omdb(title) if kind == "search" else fetch_movie(title)
+            except requests.RequestException:
+                data = None
+            if data and data.get("Error") == "Request limit reached!":
+                with _catalog_lock:
+                    _lookup_queue.extendleft(reversed(batch[n:]))
+                _lookup_wakeup.set()  # the requeued titles still need a pass
+                time.sleep(OMDB_LIMIT_BACKOFF)
+                break
+            if data and kind == "search":
+                record_search(title, data)
+            elif data:
+                record_lookup(title, data)
+            with _catalog_lock:
+                _queued_keys.discard((kind, normalize_title(title)))
+            time.sleep(OMDB_MIN_INTERVAL)
+        if batch:
+            save_catalog()
+
+def show_movie(data):
+    print(f"\nTitle: {data['Title']}")
+    print(f"Year: {data['Year']}")
+    print(f"Genre: {data['Genre']}")
+    print(f"Director: {data['Director']}")
+    print(f"IMDB Rating: {data['imdbRating']}")
+    print(f"Plot: {data['Plot']}")
+
+def get_movie_info():
     movie = input("Enter movie title: ").strip()
-    url = f"http://www.omdbapi.com/?t={movie}&apikey={api_key}"
     try:
-        res = requests.get(url, timeout=10)
-        res.raise_for_status()
-        data = res.json()
+        data = lookup_movie(movie)
         if data.get("Response") == "True":
-            print(f"\nTitle: {data['Title']}")
-            print(f"Year: {data['Year']}")
-            print(f"Genre: {data['Genre']}")
-            print(f"Director: {data['Director']}")
-            print(f"IMDB Rating: {data['imdbRating']}")
-            print(f"Plot: {data['Plot']}")
+            show_movie(data)
         else:
-            print("Movie not found!")
+            print(data.get("Error", "Movie not found!"))
     except requests.RequestException as e:
         print(f"OMDB API error: {e}")
 
+def search_movies():
+    query = input("Search seen movies: ").strip()
+    results = search_catalog(query)
+    if not results:
+        catalog = load_catalog()
+        with _catalog_lock:
+            searched_at = catalog["searches"].get(normalize_title(query), 0)
+        if time.time() - searched_at < OMDB_MISS_TTL:
+            print("No matching movies.")
+        else:
+            print("Not in the catalog yet, searching OMDB in the background.")
+            queue_lookups([query], kind="search")
+        return
+    for data in results:
+        print(f"- {data['Title']} ({data['Year']}) [{data['imdbID']}]")
+
 # AQI LAST 7 DAYS 
 def get_aqi():
     city = input("Enter city for AQI (PM2.5) data: ").strip().lower()
@@ -173,9 +881,7 @@ def get_aqi():
     }
 
     try:
-        res = requests.get(url, params=params, timeout=10)
-        res.raise_for_status()
-        data = res.json()
+        data = fetch_json(url, params=params, timeout=10)
 
         print(f"\nPM2.5 Levels in {city.title()} (last 7 days):")
         for time, value in zip(data["hourly"]["time"], data["hourly"]["pm2_5"]):
@@ -197,7 +903,12 @@ def dashboard():
         print("6. OpenWeatherMap")
         print("7. OMDB Movie Info")
         print("8. Last 7 Days AQI")
-        print("9. Exit")
+        print("9. Bulk POST from JSON Lines file")
+        print("10. Compare Crypto History")
+        print("11. Hedged Request Stats")
+        print("12. Bandwidth Stats")
+        print("13. Search Seen Movies")
+        print("14. Exit")
         choice = input("Choose option: ").strip()
         if choice == "1":
             city = input("Enter city: ")
@@ -220,6 +931,23 @@ def dashboard():
         elif choice == "8":
             get_aqi()
         elif choice == "9":
+            path = input("Enter JSON Lines file: ").strip()
+            url = input("Enter POST URL (blank for JSONPlaceholder): ").strip()
+            try:
+                run_bulk_post(path, url=url or "https://jsonplaceholder.typicode.com/posts", verbose=False)
+            except (OSError, ValueError) as e:
+                print(f"Bulk POST error: {e}")
+        elif choice == "10":
+            coins = input("Enter coins comma separated: ").split(",")
+            days = input("Days of history (default 365): ").strip()
+            compare_crypto_history([c.strip() for c in coins if c.strip()], days=int(days) if days.isdigit() else 365)
+        elif choice == "11":
+            show_hedge_stats()
+        elif choice == "12":
+            show_bandwidth_stats()
+        elif choice == "13":
+            search_movies()
+        elif choice == "14":
             print("Exiting. Thank you")
             break
         else: